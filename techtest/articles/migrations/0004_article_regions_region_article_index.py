@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_alter_article_author'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX "articles_article_regions_region_id_article_id_idx" '
+                'ON "articles_article_regions" ("region_id", "article_id");',
+            reverse_sql='DROP INDEX "articles_article_regions_region_id_article_id_idx";',
+        ),
+    ]
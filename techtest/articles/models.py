@@ -8,5 +8,9 @@ class Article(models.Model):
         'regions.Region', related_name='articles', blank=True
     )
     author = models.ForeignKey(
-        'authors.Author', on_delete=models.CASCADE, blank=True, null=True
+        'authors.Author',
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        db_index=True,
     )
@@ -1,4 +1,5 @@
 from marshmallow import validate
+from marshmallow import ValidationError
 from marshmallow import fields
 from marshmallow import Schema
 from marshmallow.decorators import post_load
@@ -14,6 +15,9 @@ class ArticleSchema(Schema):
     class Meta(object):
         model = Article
 
+    SELECT_RELATED = ("author",)
+    PREFETCH_RELATED = ("regions",)
+
     id = fields.Integer()
     title = fields.String(validate=validate.Length(max=255))
     content = fields.String()
@@ -24,17 +28,81 @@ class ArticleSchema(Schema):
         required=False, serialize="get_author", deserialize="load_author", allow_none=True
     )
 
+    def __init__(self, *args, **kwargs):
+        super(ArticleSchema, self).__init__(*args, **kwargs)
+        # Articles sharing an author reuse the dict serialized for the first one
+        self._author_cache = {}
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, only=None):
+        select_related, prefetch_related = cls.SELECT_RELATED, cls.PREFETCH_RELATED
+        if only is not None:
+            select_related = [field for field in select_related if field in only]
+            prefetch_related = [field for field in prefetch_related if field in only]
+            # "id" must always be loaded, prefetch_related matches rows on it
+            queryset = queryset.only(
+                "id", *[field for field in only if field not in cls.PREFETCH_RELATED]
+            )
+        return queryset.select_related(*select_related).prefetch_related(
+            *prefetch_related
+        )
+
     def get_regions(self, article):
         return RegionSchema().dump(article.regions.all(), many=True)
 
     def load_regions(self, regions):
-        return [
-            Region.objects.get_or_create(id=region.pop("id", None), defaults=region)[0]
-            for region in regions
+        existing_ids, upserts = [], {}
+        for region in regions:
+            region_id = region.pop("id", None)
+            if region_id is not None:
+                existing_ids.append(region_id)
+            elif region.get("code"):
+                upserts[region["code"]] = region
+            else:
+                raise ValidationError("Regions require either an id or a code")
+
+        found_ids = set(
+            Region.objects.filter(id__in=existing_ids).values_list("id", flat=True)
+        )
+        missing_ids = [
+            region_id for region_id in existing_ids if region_id not in found_ids
         ]
+        if missing_ids:
+            raise ValidationError(
+                "No Region matches the given ids: {}".format(missing_ids)
+            )
+
+        # Django 3.2 has no bulk_create(update_conflicts=True), so the upsert is
+        # one lookup by code, one bulk UPDATE and one bulk INSERT
+        current = Region.objects.in_bulk(upserts, field_name="code")
+        changed = []
+        for code, region in current.items():
+            name = upserts[code].get("name", region.name)
+            if region.name != name:
+                region.name = name
+                changed.append(region)
+        Region.objects.bulk_update(changed, ["name"])
+
+        created = [
+            Region(**region) for code, region in upserts.items() if code not in current
+        ]
+        Region.objects.bulk_create(created, ignore_conflicts=True)
+        created_ids = Region.objects.filter(
+            code__in=[region.code for region in created]
+        ).values_list("id", flat=True)
+
+        return (
+            existing_ids
+            + [region.id for region in current.values()]
+            + list(created_ids)
+        )
     
     def get_author(self, article):
-        return None if article.author is None else AuthorSchema().dump(article.author)
+        if article.author_id is None:
+            return None
+        if article.author_id not in self._author_cache:
+            self._author_cache[article.author_id] = AuthorSchema().dump(article.author)
+        return self._author_cache[article.author_id]
     
     def load_author(self, author):
         return Author.objects.get_or_create(id=author.pop("id", None), defaults=author)[0]
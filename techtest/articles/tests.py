@@ -1,6 +1,8 @@
-import json
+import orjson
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from techtest.articles.models import Article
@@ -9,57 +11,94 @@ from techtest.authors.models import Author
 
 
 class ArticleListViewTestCase(TestCase):
-    def setUp(self):
-        self.url = reverse("articles-list")
-        self.article_1 = Article.objects.create(title="Fake Article 1")
-        self.region_1 = Region.objects.create(code="AL", name="Albania")
-        self.region_2 = Region.objects.create(code="UK", name="United Kingdom")
-        self.author_1 = Author.objects.create(first_name="foo", last_name="bar")
-        self.article_2 = Article.objects.create(
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.region_1 = Region.objects.create(code="AL", name="Albania")
+        cls.region_2 = Region.objects.create(code="UK", name="United Kingdom")
+        cls.author_1 = Author.objects.create(first_name="foo", last_name="bar")
+        cls.article_1 = Article.objects.create(
+            title="Fake Article 1", author=cls.author_1
+        )
+        cls.article_2 = Article.objects.create(
             title="Fake Article 2", content="Lorem Ipsum"
         )
-        self.article_1.author = self.author_1
-        self.article_1.save()
-        self.article_2.regions.set([self.region_1, self.region_2])
+        cls.article_2.regions.set([cls.region_1, cls.region_2])
+        cls.url = reverse("articles-list")
+        cls.expected = [
+            {
+                "id": cls.article_1.id,
+                "title": "Fake Article 1",
+                "content": "",
+                "author": {
+                    "id": cls.author_1.id,
+                    "first_name": "foo",
+                    "last_name": "bar"
+                },
+                "regions": [],
+            },
+            {
+                "id": cls.article_2.id,
+                "title": "Fake Article 2",
+                "content": "Lorem Ipsum",
+                "author": None,
+                "regions": [
+                    {
+                        "id": cls.region_1.id,
+                        "code": "AL",
+                        "name": "Albania",
+                    },
+                    {
+                        "id": cls.region_2.id,
+                        "code": "UK",
+                        "name": "United Kingdom",
+                    },
+                ],
+            },
+        ]
 
     def test_serializes_with_correct_data_shape_and_status_code(self):
-        response = self.client.get(self.url)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(orjson.loads(response.content), self.expected)
+
+    def test_query_count_does_not_grow_with_number_of_articles(self):
+        for i in range(50):
+            article = Article.objects.create(
+                title="Bulk Article {}".format(i), author=self.author_1
+            )
+            article.regions.set([self.region_1, self.region_2])
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
+        articles = orjson.loads(response.content)
+        self.assertEqual(len(articles), 52)
+        ids = {self.article_1.id, self.article_2.id}
         self.assertCountEqual(
-            response.json(),
+            [article for article in articles if article["id"] in ids],
+            self.expected,
+        )
+
+    def test_serializes_only_requested_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"fields": "id,title"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"content"', queries[0]["sql"])
+        self.assertCountEqual(
+            orjson.loads(response.content),
             [
-                {
-                    "id": self.article_1.id,
-                    "title": "Fake Article 1",
-                    "content": "",
-                    "author": {
-                        "id": self.author_1.id,
-                        "first_name": "foo",
-                        "last_name": "bar"
-                    },
-                    "regions": [],
-                },
-                {
-                    "id": self.article_2.id,
-                    "title": "Fake Article 2",
-                    "content": "Lorem Ipsum",
-                    "author": None,
-                    "regions": [
-                        {
-                            "id": self.region_1.id,
-                            "code": "AL",
-                            "name": "Albania",
-                        },
-                        {
-                            "id": self.region_2.id,
-                            "code": "UK",
-                            "name": "United Kingdom",
-                        },
-                    ],
-                },
+                {"id": self.article_1.id, "title": "Fake Article 1"},
+                {"id": self.article_2.id, "title": "Fake Article 2"},
             ],
         )
 
+    def test_rejects_unknown_fields(self):
+        response = self.client.get(self.url, {"fields": "id,foo"})
+        self.assertEqual(response.status_code, 400)
+
     def test_creates_new_article_with_regions_and_author(self):
         payload = {
             "title": "Fake Article 3",
@@ -73,13 +112,12 @@ class ArticleListViewTestCase(TestCase):
             ],
         }
         response = self.client.post(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        article = Article.objects.last()
-        regions = Region.objects.filter(articles__id=article.id)
         self.assertEqual(response.status_code, 201)
-        self.assertIsNotNone(article)
-        self.assertEqual(regions.count(), 2)
+        article = Article.objects.get(pk=orjson.loads(response.content)["id"])
+        region_list = list(Region.objects.filter(articles__id=article.id))
+        self.assertEqual(len(region_list), 2)
         self.assertDictEqual(
             {
                 "id": article.id,
@@ -92,31 +130,34 @@ class ArticleListViewTestCase(TestCase):
                 },
                 "regions": [
                     {
-                        "id": regions.all()[0].id,
+                        "id": region_list[0].id,
                         "code": "US",
                         "name": "United States of America",
                     },
-                    {"id": regions.all()[1].id, "code": "AU", "name": "Austria"},
+                    {"id": region_list[1].id, "code": "AU", "name": "Austria"},
                 ],
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
 
 class ArticleViewTestCase(TestCase):
-    def setUp(self):
-        self.article = Article.objects.create(title="Fake Article 1")
-        self.region_1 = Region.objects.create(code="AL", name="Albania")
-        self.region_2 = Region.objects.create(code="UK", name="United Kingdom")
-        self.author_1 = Author.objects.create(first_name="foo", last_name="bar")
-        self.article.regions.set([self.region_1, self.region_2])
-        self.url = reverse("article", kwargs={"article_id": self.article.id})
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.article = Article.objects.create(title="Fake Article 1")
+        cls.region_1 = Region.objects.create(code="AL", name="Albania")
+        cls.region_2 = Region.objects.create(code="UK", name="United Kingdom")
+        cls.author_1 = Author.objects.create(first_name="foo", last_name="bar")
+        cls.article.regions.set([cls.region_1, cls.region_2])
+        cls.url = reverse("article", kwargs={"article_id": cls.article.id})
 
     def test_serializes_single_record_with_correct_data_shape_and_status_code(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertCountEqual(
-            response.json(),
+        self.assertDictEqual(
+            orjson.loads(response.content),
             {
                 "id": self.article.id,
                 "title": "Fake Article 1",
@@ -148,17 +189,15 @@ class ArticleViewTestCase(TestCase):
             ],
         }
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        article = Article.objects.first()
-        regions = Region.objects.filter(articles__id=article.id)
+        region_list = list(Region.objects.filter(articles__id=self.article.id))
         self.assertEqual(response.status_code, 200)
-        self.assertIsNotNone(article)
-        self.assertEqual(regions.count(), 2)
+        self.assertEqual(len(region_list), 2)
         self.assertEqual(Article.objects.count(), 1)
         self.assertDictEqual(
             {
-                "id": article.id,
+                "id": self.article.id,
                 "title": "Fake Article 1 (Modified)",
                 "content": "To be or not to be here",
                 "author": None,
@@ -169,35 +208,74 @@ class ArticleViewTestCase(TestCase):
                         "name": "United Kingdom",
                     },
                     {
-                        "id": regions.all()[1].id,
+                        "id": region_list[1].id,
                         "code": "US",
                         "name": "United States of America",
                     },
                 ],
             },
-            response.json(),
+            orjson.loads(response.content),
         )
         # Remove regions
         payload["regions"] = []
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        article = Article.objects.last()
-        regions = Region.objects.filter(articles__id=article.id)
+        regions = Region.objects.filter(articles__id=self.article.id)
         self.assertEqual(response.status_code, 200)
-        self.assertIsNotNone(article)
         self.assertEqual(regions.count(), 0)
         self.assertDictEqual(
             {
-                "id": article.id,
+                "id": self.article.id,
                 "title": "Fake Article 1 (Modified)",
                 "content": "To be or not to be here",
                 "author": None,
                 "regions": [],
             },
-            response.json(),
+            orjson.loads(response.content),
+        )
+
+    def test_upserts_regions_by_code(self):
+        payload = {
+            "title": "Fake Article 1 (Modified)",
+            "regions": [
+                {"code": "AL", "name": "Republic of Albania"},
+                {"code": "US", "name": "United States of America"},
+            ],
+        }
+        response = self.client.put(
+            self.url, data=orjson.dumps(payload), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Region.objects.count(), 3)
+        self.assertCountEqual(
+            orjson.loads(response.content)["regions"],
+            [
+                {
+                    "id": self.region_1.id,
+                    "code": "AL",
+                    "name": "Republic of Albania",
+                },
+                {
+                    "id": Region.objects.get(code="US").id,
+                    "code": "US",
+                    "name": "United States of America",
+                },
+            ],
         )
 
+    def test_rejects_unknown_region_ids(self):
+        payload = {
+            "title": "Fake Article 1 (Modified)",
+            "regions": [{"id": self.region_1.id}, {"id": 0}],
+        }
+        response = self.client.put(
+            self.url, data=orjson.dumps(payload), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("regions", orjson.loads(response.content))
+        self.assertEqual(Article.objects.get().title, "Fake Article 1")
+
     def test_updates_article_and_author(self):
         # Change author
         payload = {
@@ -208,17 +286,15 @@ class ArticleViewTestCase(TestCase):
             }
         }
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        article = Article.objects.first()
-        regions = Region.objects.filter(articles__id=article.id)
+        regions = Region.objects.filter(articles__id=self.article.id)
         self.assertEqual(response.status_code, 200)
-        self.assertIsNotNone(article)
         self.assertEqual(regions.count(), 2)
         self.assertEqual(Article.objects.count(), 1)
         self.assertDictEqual(
             {
-                "id": article.id,
+                "id": self.article.id,
                 "title": "Fake Article 1 (Modified)",
                 "content": "To be or not to be here",
                 "author": {
@@ -239,7 +315,7 @@ class ArticleViewTestCase(TestCase):
                     },
                 ],
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
         # skipping author doesn't remove author
@@ -248,16 +324,14 @@ class ArticleViewTestCase(TestCase):
             "content": "To be or not to be here",
         }
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        article = Article.objects.last()
-        regions = Region.objects.filter(articles__id=article.id)
+        regions = Region.objects.filter(articles__id=self.article.id)
         self.assertEqual(response.status_code, 200)
-        self.assertIsNotNone(article)
         self.assertEqual(regions.count(), 2)
         self.assertDictEqual(
             {
-                "id": article.id,
+                "id": self.article.id,
                 "title": "Fake Article 1 (Modified)",
                 "content": "To be or not to be here",
                 "author": {
@@ -278,22 +352,20 @@ class ArticleViewTestCase(TestCase):
                     },
                 ],
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
         # Remove author
         payload["author"] = None
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        article = Article.objects.last()
-        regions = Region.objects.filter(articles__id=article.id)
+        regions = Region.objects.filter(articles__id=self.article.id)
         self.assertEqual(response.status_code, 200)
-        self.assertIsNotNone(article)
         self.assertEqual(regions.count(), 2)
         self.assertDictEqual(
             {
-                "id": article.id,
+                "id": self.article.id,
                 "title": "Fake Article 1 (Modified)",
                 "content": "To be or not to be here",
                 "author": None,
@@ -310,7 +382,7 @@ class ArticleViewTestCase(TestCase):
                     },
                 ],
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
     def test_removes_article(self):
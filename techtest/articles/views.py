@@ -1,6 +1,7 @@
-import json
+import orjson
 
 from marshmallow import ValidationError
+from django.db import transaction
 from django.views.generic import View
 
 from techtest.articles.models import Article
@@ -9,12 +10,22 @@ from techtest.utils import json_response
 
 
 class ArticlesListView(View):
+    def get_queryset(self, only=None):
+        return ArticleSchema.setup_eager_loading(Article.objects.all(), only)
+
     def get(self, request, *args, **kwargs):
-        return json_response(ArticleSchema().dump(Article.objects.all(), many=True))
+        only = request.GET.get("fields")
+        only = only.split(",") if only else None
+        try:
+            schema = ArticleSchema(only=only)
+        except ValueError as e:
+            return json_response({"error": str(e)}, 400)
+        return json_response(schema.dump(self.get_queryset(only), many=True))
 
     def post(self, request, *args, **kwargs):
         try:
-            article = ArticleSchema().load(json.loads(request.body))
+            with transaction.atomic():
+                article = ArticleSchema().load(orjson.loads(request.body))
         except ValidationError as e:
             return json_response(e.messages, 400)
         return json_response(ArticleSchema().dump(article), 201)
@@ -26,7 +37,7 @@ class ArticleView(View):
             self.article = Article.objects.get(pk=article_id)
         except Article.DoesNotExist:
             return json_response({"error": "No Article matches the given query"}, 404)
-        self.data = request.body and dict(json.loads(request.body), id=self.article.id)
+        self.data = request.body and dict(orjson.loads(request.body), id=self.article.id)
         return super(ArticleView, self).dispatch(request, *args, **kwargs)
 
     def get(self, request, *args, **kwargs):
@@ -34,7 +45,8 @@ class ArticleView(View):
 
     def put(self, request, *args, **kwargs):
         try:
-            self.article = ArticleSchema().load(self.data)
+            with transaction.atomic():
+                self.article = ArticleSchema().load(self.data)
         except ValidationError as e:
             return json_response(e.messages, 400)
         return json_response(ArticleSchema().dump(self.article))
@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from django.test import TestCase
 from django.urls import reverse
@@ -7,16 +7,19 @@ from techtest.authors.models import Author
 
 
 class AuthorListViewTestCase(TestCase):
-    def setUp(self):
-        self.url = reverse("authors-list")
-        self.author_1 = Author.objects.create(first_name="alice", last_name="bob")
-        self.author_2 = Author.objects.create(first_name="carl", last_name="david")
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author_1 = Author.objects.create(first_name="alice", last_name="bob")
+        cls.author_2 = Author.objects.create(first_name="carl", last_name="david")
+        cls.url = reverse("authors-list")
 
     def test_serializes_with_correct_data_shape_and_status_code(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertCountEqual(
-            response.json(),
+            orjson.loads(response.content),
             [
                 {
                     "id": self.author_1.id,
@@ -37,11 +40,10 @@ class AuthorListViewTestCase(TestCase):
             "last_name": "bar",
         }
         response = self.client.post(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        author = Author.objects.last()
         self.assertEqual(response.status_code, 201)
-        self.assertIsNotNone(author)
+        author = Author.objects.get(pk=orjson.loads(response.content)["id"])
         self.assertEqual(Author.objects.count(), 3)
         self.assertDictEqual(
             {
@@ -49,20 +51,23 @@ class AuthorListViewTestCase(TestCase):
                 "first_name": "foo",
                 "last_name": "bar",
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
 
 class AuthorViewTestCase(TestCase):
-    def setUp(self):
-        self.author = Author.objects.create(first_name="foo", last_name="bar")
-        self.url = reverse("author", kwargs={"author_id": self.author.id})
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(first_name="foo", last_name="bar")
+        cls.url = reverse("author", kwargs={"author_id": cls.author.id})
 
     def test_serializes_single_record_with_correct_data_shape_and_status_code(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertCountEqual(
-            response.json(),
+        self.assertDictEqual(
+            orjson.loads(response.content),
             {
                 "id": self.author.id,
                 "first_name": "foo",
@@ -77,7 +82,7 @@ class AuthorViewTestCase(TestCase):
             "last_name": "bar1",
         }
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
         author = Author.objects.filter(id=self.author.id).first()
         self.assertEqual(response.status_code, 200)
@@ -89,7 +94,7 @@ class AuthorViewTestCase(TestCase):
                 "first_name": "foo1",
                 "last_name": "bar1",
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
     def test_removes_region(self):
@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from marshmallow import ValidationError
 from django.views.generic import View
@@ -14,7 +14,7 @@ class AuthorsListView(View):
 
     def post(self, request, *args, **kwargs):
         try:
-            author = AuthorSchema().load(json.loads(request.body))
+            author = AuthorSchema().load(orjson.loads(request.body))
         except ValidationError as e:
             return json_response(e.messages, 400)
         return json_response(AuthorSchema().dump(author), 201)
@@ -26,7 +26,7 @@ class AuthorView(View):
             self.author = Author.objects.get(pk=author_id)
         except Author.DoesNotExist:
             return json_response({"error": "No Author matches the given query"}, 404)
-        self.data = request.body and dict(json.loads(request.body), id=self.author.id)
+        self.data = request.body and dict(orjson.loads(request.body), id=self.author.id)
         return super(AuthorView, self).dispatch(request, *args, **kwargs)
 
     def get(self, request, *args, **kwargs):
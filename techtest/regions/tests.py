@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from django.test import TestCase
 from django.urls import reverse
@@ -7,16 +7,19 @@ from techtest.regions.models import Region
 
 
 class RegionListViewTestCase(TestCase):
-    def setUp(self):
-        self.url = reverse("regions-list")
-        self.region_1 = Region.objects.create(code="AL", name="Albania")
-        self.region_2 = Region.objects.create(code="UK", name="United Kingdom")
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.region_1 = Region.objects.create(code="AL", name="Albania")
+        cls.region_2 = Region.objects.create(code="UK", name="United Kingdom")
+        cls.url = reverse("regions-list")
 
     def test_serializes_with_correct_data_shape_and_status_code(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertCountEqual(
-            response.json(),
+            orjson.loads(response.content),
             [
                 {
                     "id": self.region_1.id,
@@ -37,11 +40,10 @@ class RegionListViewTestCase(TestCase):
             "name": "United States of America",
         }
         response = self.client.post(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
-        region = Region.objects.last()
         self.assertEqual(response.status_code, 201)
-        self.assertIsNotNone(region)
+        region = Region.objects.get(pk=orjson.loads(response.content)["id"])
         self.assertEqual(Region.objects.count(), 3)
         self.assertDictEqual(
             {
@@ -49,20 +51,23 @@ class RegionListViewTestCase(TestCase):
                 "code": "US",
                 "name": "United States of America",
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
 
 class RegionViewTestCase(TestCase):
-    def setUp(self):
-        self.region = Region.objects.create(code="AL", name="Albania")
-        self.url = reverse("region", kwargs={"region_id": self.region.id})
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(code="AL", name="Albania")
+        cls.url = reverse("region", kwargs={"region_id": cls.region.id})
 
     def test_serializes_single_record_with_correct_data_shape_and_status_code(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertCountEqual(
-            response.json(),
+        self.assertDictEqual(
+            orjson.loads(response.content),
             {
                 "id": self.region.id,
                 "code": "AL",
@@ -77,7 +82,7 @@ class RegionViewTestCase(TestCase):
             "name": "United States of America",
         }
         response = self.client.put(
-            self.url, data=json.dumps(payload), content_type="application/json"
+            self.url, data=orjson.dumps(payload), content_type="application/json"
         )
         region = Region.objects.filter(id=self.region.id).first()
         self.assertEqual(response.status_code, 200)
@@ -89,7 +94,7 @@ class RegionViewTestCase(TestCase):
                 "code": "US",
                 "name": "United States of America",
             },
-            response.json(),
+            orjson.loads(response.content),
         )
 
     def test_removes_region(self):
@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from marshmallow import ValidationError
 from django.views.generic import View
@@ -14,7 +14,7 @@ class RegionsListView(View):
 
     def post(self, request, *args, **kwargs):
         try:
-            region = RegionSchema().load(json.loads(request.body))
+            region = RegionSchema().load(orjson.loads(request.body))
         except ValidationError as e:
             return json_response(e.messages, 400)
         return json_response(RegionSchema().dump(region), 201)
@@ -26,7 +26,7 @@ class RegionView(View):
             self.region = Region.objects.get(pk=region_id)
         except Region.DoesNotExist:
             return json_response({"error": "No Region matches the given query"}, 404)
-        self.data = request.body and dict(json.loads(request.body), id=self.region.id)
+        self.data = request.body and dict(orjson.loads(request.body), id=self.region.id)
         return super(RegionView, self).dispatch(request, *args, **kwargs)
 
     def get(self, request, *args, **kwargs):
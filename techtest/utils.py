@@ -1,8 +1,10 @@
-import json
+import orjson
 from django.http.response import HttpResponse
 
 
 def json_response(data={}, status=200):
     return HttpResponse(
-        content=json.dumps(data), status=status, content_type="application/json"
+        content=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        content_type="application/json",
     )